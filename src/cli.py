@@ -1,5 +1,5 @@
 # standard library imports
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 import socket
 
@@ -12,56 +12,70 @@ from dotenv import load_dotenv
 
 
 # =========================== INPUT DATETIME RANGE ======================== #
+TZ = timezone(timedelta(hours=-7))
+
+
+def parse_day(day: str) -> datetime:
+    # an empty day defaults to today
+    if day:
+        year, month, day_of_month = map(int, day.split("-"))
+    else:
+        today = datetime.now()
+        year, month, day_of_month = today.year, today.month, today.day
+    return datetime(year, month, day_of_month, tzinfo=TZ)
+
+
+def parse_time(time: str) -> tuple[int, int]:
+    hour, minute = map(int, time.split(":"))
+    return hour, minute
+
+
 def input_day() -> tuple[datetime, datetime]:
-    date = input("Enter the day (YYYY-MM-DD). Press Enter for today:\n")
-    if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
-    start_datetime = date + "T00:00:00-07:00"
-    end_datetime = date + "T23:59:59-07:00"
+    day = parse_day(
+        input("Enter the day (YYYY-MM-DD). Press Enter for today:\n")
+    )
     return (
-        datetime.fromisoformat(start_datetime),
-        datetime.fromisoformat(end_datetime)
+        day,
+        day.replace(hour=23, minute=59, second=59)
     )
 
 
 def input_week() -> tuple[datetime, datetime]:
-    date = input(
-        (
-            "Enter the start day (YYYY-MM-DD) of the week. "
-            "Press Enter for today:\n"
+    start = parse_day(
+        input(
+            (
+                "Enter the start day (YYYY-MM-DD) of the week. "
+                "Press Enter for today:\n"
+            )
         )
     )
-    if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
-    start_datetime = date + "T00:00:00-07:00"
-    date_obj = datetime.fromisoformat(date) + timedelta(days=6)
-    end_datetime = date_obj.strftime("%Y-%m-%d") + "T23:59:59-07:00"
+    end = start + timedelta(days=6)
     return (
-        datetime.fromisoformat(start_datetime),
-        datetime.fromisoformat(end_datetime)
+        start,
+        end.replace(hour=23, minute=59, second=59)
     )
 
 
 def input_datetime_range() -> tuple[datetime, datetime]:
-    start_date = input(
-        "Enter the start day (YYYY-MM-DD). Press Enter for today:\n"
+    start_day = parse_day(
+        input("Enter the start day (YYYY-MM-DD). Press Enter for today:\n")
     )
-    if not start_date:
-        start_date = datetime.now().strftime("%Y-%m-%d")
     start_time = input("Enter the start time (HH:MM): ")
     if not start_time:
         start_time = "00:00"
     end_date = input("Enter the end date (YYYY-MM-DD): ")
-    if not end_date:
-        end_date = start_date
+    if end_date:
+        end_day = parse_day(end_date)
+    else:
+        end_day = start_day
     end_time = input("Enter the end time (HH:MM): ")
     if not end_time:
         end_time = "23:59"
-    start_datetime = f"{start_date}T{start_time}:00-07:00"
-    end_datetime = f"{end_date}T{end_time}:00-07:00"
+    start_hour, start_minute = parse_time(start_time)
+    end_hour, end_minute = parse_time(end_time)
     return (
-        datetime.fromisoformat(start_datetime),
-        datetime.fromisoformat(end_datetime)
+        start_day.replace(hour=start_hour, minute=start_minute),
+        end_day.replace(hour=end_hour, minute=end_minute)
     )
 
 
@@ -74,12 +88,12 @@ def main():
         count += 1
     option = input(f"Select a number 1-{len(options)}: ")
 
-    slack_client = slack.SlackClient()
+    slack_client = slack.get_slack_client()
     channel_id = "D08TTLFB7RN"
 
     if option == "1":
         start, end = input_day()
-        print(start, end)
+        logging.debug("auditing day from %s to %s", start, end)
         analysis = task_lib.audit_slack(
             slack_client=slack_client,
             channel_id=channel_id,
@@ -99,16 +113,10 @@ def main():
         )
         print(analysis)
 
-        # audit each day of the week
+        # audit each day of the week from the week's tasks
         cur = start
         while cur <= end:
-            analysis = task_lib.audit_slack(
-                slack_client=slack_client,
-                channel_id=channel_id,
-                start=cur,
-                end=cur + timedelta(days=1)
-            )
-            print(analysis)
+            print(analysis.filter(cur, cur + timedelta(days=1)))
             cur += timedelta(days=1)
 
     elif option == "3":
@@ -1,7 +1,9 @@
 # standard library imports
+from functools import lru_cache
 import os
 
 
+@lru_cache(maxsize=1)
 def slack_bot_token():
     return os.environ["SLACK_BOT_TOKEN"]
 
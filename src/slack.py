@@ -1,5 +1,7 @@
 # standard library imports
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
 # internal library imports
@@ -8,34 +10,19 @@ from env import slack_bot_token
 # third party imports
 from dotenv import load_dotenv
 from slack_sdk import WebClient
-import pytz
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 
-@dataclass
+UTC = timezone.utc
+
+
+@dataclass(slots=True)
 class SlackMessage:
     user: str
     type: str
     timestamp: datetime
     text: str
 
-    def __lt__(self, other):
-        return self.timestamp < other.timestamp
-
-    def __le__(self, other):
-        return self.timestamp <= other.timestamp
-
-    def __gt__(self, other):
-        return self.timestamp > other.timestamp
-
-    def __ge__(self, other):
-        return self.timestamp >= other.timestamp
-
-    def __eq__(self, other):
-        return self.timestamp == other.timestamp
-
-    def __ne__(self, other):
-        return self.timestamp != other.timestamp
-
     def __str__(self):
         formatted_user = f"user: {self.user}"
         formatted_type = f"type: {self.type}"
@@ -51,10 +38,28 @@ class SlackMessage:
         )
 
 
+def to_slack_messages(messages: list[dict]) -> list[SlackMessage]:
+    fromtimestamp = datetime.fromtimestamp
+    return [
+        SlackMessage(
+            user=message["user"],
+            type=message["type"],
+            timestamp=fromtimestamp(float(message["ts"]), UTC),
+            text=message["text"]
+        )
+        for message in messages
+    ]
+
+
 class SlackClient:
 
     def __init__(self):
         client = WebClient(token=slack_bot_token())
+        # concurrent fetches can trip slack's rate limits, so wait out the
+        # Retry-After header instead of failing the request
+        client.retry_handlers.append(
+            RateLimitErrorRetryHandler(max_retry_count=3)
+        )
         self.client = client
 
     def get_conversation_history(
@@ -78,8 +83,7 @@ class SlackClient:
         else:
             oldest_timestamp = None
 
-        # retrieve the messages
-        found_preceeding_older_count = 0
+        # retrieve the messages in the window, letting slack filter by oldest
         while has_more:
             response = self.client.conversations_history(
                 channel=channel_id,
@@ -88,32 +92,44 @@ class SlackClient:
                 limit=200,
                 cursor=next_cursor,
                 latest=latest_timestamp,
+                oldest=oldest_timestamp,
             )
-
-            # transform the messages to the slack message object
-            messages = response['messages']
-            for message in messages:
-                slack_message = SlackMessage(
-                    user=message["user"],
-                    type=message["type"],
-                    timestamp=datetime.fromtimestamp(float(message["ts"]), pytz.utc),
-                    text=message["text"]
-                )
-                if (
-                    oldest_timestamp and
-                    slack_message.timestamp.timestamp() < oldest_timestamp
-                ):
-                    found_preceeding_older_count += 1
-                if found_preceeding_older_count > preceeding_older_count:
-                    return slack_messages
-                slack_messages.append(slack_message)
+            slack_messages.extend(to_slack_messages(response['messages']))
 
             has_more = response['has_more']
             if has_more:
                 next_cursor = response['response_metadata'].get('next_cursor')
 
+        # retrieve the messages just before the window
+        if oldest_timestamp and preceeding_older_count > 0:
+            response = self.client.conversations_history(
+                channel=channel_id,
+                limit=preceeding_older_count,
+                latest=oldest_timestamp,
+            )
+            slack_messages.extend(to_slack_messages(response['messages']))
+
         return slack_messages
 
+    def get_conversation_histories(
+        self,
+        channel_ids: list[str],
+        latest: datetime | None = None,
+        oldest: datetime | None = None,
+        preceeding_older_count: int = 0,
+    ) -> list[list[SlackMessage]]:
+        # fetch the channels concurrently, keeping the order of channel_ids
+        def get_history(channel_id: str) -> list[SlackMessage]:
+            return self.get_conversation_history(
+                channel_id,
+                latest=latest,
+                oldest=oldest,
+                preceeding_older_count=preceeding_older_count,
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(get_history, channel_ids))
+
     def list_conversations(self):
         return self.client.conversations_list()
 
@@ -130,11 +146,16 @@ class SlackClient:
         return user_conversation
 
 
+@lru_cache(maxsize=1)
+def get_slack_client() -> SlackClient:
+    return SlackClient()
+
+
 def main():
     # load the environment variables
     load_dotenv()
 
-    slack_client = SlackClient()
+    slack_client = get_slack_client()
 
     # retrieve slackbot dms
     dms = slack_client.list_user_conversations()
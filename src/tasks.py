@@ -1,7 +1,7 @@
 # standard library imports
-from copy import deepcopy
-from dataclasses import dataclass
-from datetime import datetime, timedelta, MINYEAR
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone, MINYEAR
+from itertools import pairwise
 import re
 
 # internal library imports
@@ -10,33 +10,17 @@ import utils
 
 # external library imports
 from dotenv import load_dotenv
-import pytz
 
 
-@dataclass
+_TAG_RE = re.compile(r"\[([^\]]*)\]")
+
+
+@dataclass(slots=True)
 class Task:
     start: datetime
     end: datetime
     tags: list[str]
 
-    def __lt__(self, other):
-        return self.start < other.start
-
-    def __le__(self, other):
-        return self.start <= other.start
-
-    def __gt__(self, other):
-        return self.end > other.end
-
-    def __ge__(self, other):
-        return self.end >= other.end
-
-    def __eq__(self, other):
-        return self.start == other.start and self.end == other.end
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
     def __str__(self):
         formatted_start = f"start: {self.start}"
         formatted_end = f"end: {self.end}"
@@ -59,7 +43,7 @@ class Task:
         return Task(
             start=self.start,
             end=self.end,
-            tags=deepcopy(self.tags)
+            tags=self.tags[:]
         )
 
 
@@ -67,29 +51,33 @@ class Task:
 class TagTasks:
     tag: str
     tasks: list[Task]
+    min_start: datetime | None = field(default=None, init=False)
+    max_end: datetime | None = field(default=None, init=False)
+    _duration: timedelta = field(default=timedelta(0), init=False)
+
+    def __post_init__(self):
+        # track the bounds and duration of the initial tasks
+        tasks = self.tasks
+        self.tasks = []
+        for task in tasks:
+            self.add_task(task)
 
     def add_task(self, new_task):
         self.tasks.append(new_task)
+        if self.min_start is None or new_task.start < self.min_start:
+            self.min_start = new_task.start
+        if self.max_end is None or new_task.end > self.max_end:
+            self.max_end = new_task.end
+        self._duration += new_task.duration
 
     @property
     def duration(self) -> timedelta:
-        duration = timedelta(0)
-        for task in self.tasks:
-            duration += task.duration
-        return duration
+        return self._duration
 
     @property
     def num_tasks(self) -> int:
         return len(self.tasks)
 
-    def first_task(self) -> Task:
-        self.tasks.sort()
-        return self.tasks[0]
-
-    def last_task(self) -> Task:
-        self.tasks.sort()
-        return self.tasks[-1]
-
 
 class TaskAnalysis:
     def __init__(
@@ -97,85 +85,93 @@ class TaskAnalysis:
         tasks: list[Task],
         first_tag_only: bool = True,
     ):
+        self.tasks = tasks
+        self.first_tag_only = first_tag_only
         self.tag_to_tasks: dict[str, TagTasks] = {}
 
-        # helper function for addings tasks to the dictionary
-        def add_entry(tag, task):
-            if tag in self.tag_to_tasks:
-                self.tag_to_tasks[tag].add_task(task.copy())
-            else:
-                self.tag_to_tasks[tag] = TagTasks(
-                    tag=tag,
-                    tasks=[task.copy()]
-                )
-
-        for task in tasks:
-            if first_tag_only:
-                add_entry(task.tags[0], task.copy())
-            else:
+        # tasks are never mutated after construction, so they are shared
+        # between tags rather than copied
+        tag_to_tasks = self.tag_to_tasks
+        all_tasks_duration = timedelta(0)
+        if first_tag_only:
+            for task in tasks:
+                tag = task.tags[0]
+                tag_tasks = tag_to_tasks.get(tag)
+                if tag_tasks is None:
+                    tag_to_tasks[tag] = TagTasks(tag=tag, tasks=[task])
+                else:
+                    tag_tasks.add_task(task)
+                all_tasks_duration += task.duration
+        else:
+            for task in tasks:
                 for tag in task.tags:
-                    add_entry(tag, task.copy())
-
-    def __max_duration_chars(self) -> int:
-        durations = []
-        for tag, tag_tasks in self.tag_to_tasks.items():
-            durations.append(f"{tag_tasks.duration}")
-        durations.append(f"{self.all_tasks_duration()}")
-        return utils.max_string_length(durations)
+                    tag_tasks = tag_to_tasks.get(tag)
+                    if tag_tasks is None:
+                        tag_to_tasks[tag] = TagTasks(tag=tag, tasks=[task])
+                    else:
+                        tag_tasks.add_task(task)
+                    all_tasks_duration += task.duration
+        self._all_tasks_duration = all_tasks_duration
 
     def __str__(self):
-        result = ""
+        # compute each row's duration and percent of total in one pass
+        analysis_duration_secs = self.analysis_duration.total_seconds()
+        rows = []
+        for tag, tag_tasks in self.tag_to_tasks.items():
+            duration = tag_tasks.duration
+            decimal_of_total = (
+                duration.total_seconds() / analysis_duration_secs
+            )
+            percent_of_total = f"{round(decimal_of_total * 100, 2):.2f}"
+            rows.append((tag, f"{duration}", percent_of_total))
+        all_tasks_duration = self.all_tasks_duration()
+        decimal_of_total = (
+            all_tasks_duration.total_seconds() / analysis_duration_secs
+        )
+        percent_of_total = f"{round(decimal_of_total * 100, 2):.2f}"
+        total_row = ("Total", f"{all_tasks_duration}", percent_of_total)
 
         # determine lengths of stuff for formatting
         max_tag_chars = utils.max_string_length(self.tags)
-        max_duration_chars = self.__max_duration_chars()
+        max_duration_chars = utils.max_string_length(
+            [row[1] for row in rows] + [total_row[1]]
+        )
 
         # format the title
         col1 = f"{'Tag':^{max_tag_chars}}"
         col2 = f"{'Duration':^{max_duration_chars}}"
         col3 = f"{'% of Total':^10}"
         title = f"| {col1} | {col2} | {col3} |"
-        result += f"+{'-' * (len(title) - 2)}+\n"
-        result += title + "\n"
-        result += f"+{'-' * (len(title) - 2)}+" + "\n"
+        hr = f"+{'-' * (len(title) - 2)}+"
+        lines = [hr, title, hr]
 
         # per task analysis
-        analysis_duration_secs = self.analysis_duration.total_seconds()
-        for tag, tag_tasks in self.tag_to_tasks.items():
-            task_duration = f"{tag_tasks.duration}"
-
-            # percent of total
-            tag_tasks_duration_secs = tag_tasks.duration.total_seconds()
-            decimal_of_total = tag_tasks_duration_secs / analysis_duration_secs
-            percent_of_total = f"{round(decimal_of_total * 100, 2):.2f}"
-
-            # formatting
-            col1 = f"{tag:^{max_tag_chars}}"
-            col2 = f"{task_duration:^{max_duration_chars}}"
-            col3 = f"{percent_of_total:^10}"
-            result += f"| {col1} | {col2} | {col3} |\n"
-        result += f"+{'-' * (len(title) - 2)}+\n"
+        for tag, task_duration, percent_of_total in rows:
+            lines.append(
+                f"| {tag:^{max_tag_chars}} "
+                f"| {task_duration:^{max_duration_chars}} "
+                f"| {percent_of_total:^10} |"
+            )
+        lines.append(hr)
 
         # all tasks analysis
-        all_tasks_duration = f"{self.all_tasks_duration()}"
-        all_tasks_duration_secs = self.all_tasks_duration().total_seconds()
-        decimal_of_total = all_tasks_duration_secs / analysis_duration_secs
-        percent_of_total = f"{round(decimal_of_total * 100, 2):.2f}"
-        col1 = f"{'Total':^{max_tag_chars}}"
-        col2 = f"{all_tasks_duration:^{max_duration_chars}}"
-        col3 = f"{percent_of_total:^10}"
-        result += f"| {col1} | {col2} | {col3} |\n"
-        result += f"+{'-' * (len(title) - 2)}+"
+        tag, all_tasks_duration, percent_of_total = total_row
+        lines.append(
+            f"| {tag:^{max_tag_chars}} "
+            f"| {all_tasks_duration:^{max_duration_chars}} "
+            f"| {percent_of_total:^10} |"
+        )
+        lines.append(hr)
 
-        return result
+        return "\n".join(lines)
 
     @property
     def analysis_duration(self) -> timedelta:
-        start = datetime.now(pytz.utc)
-        end = datetime(MINYEAR, 1, 1, tzinfo=pytz.utc)
+        start = datetime.now(timezone.utc)
+        end = datetime(MINYEAR, 1, 1, tzinfo=timezone.utc)
         for _, tag_tasks in self.tag_to_tasks.items():
-            start = min(start, tag_tasks.first_task().start)
-            end = max(end, tag_tasks.last_task().end)
+            start = min(start, tag_tasks.min_start)
+            end = max(end, tag_tasks.max_end)
         return end - start
 
     @property
@@ -192,23 +188,32 @@ class TaskAnalysis:
         return max_tasks
 
     def all_tasks_duration(self) -> timedelta:
-        all_tasks_duration = timedelta(0)
-        for _, tag_tasks in self.tag_to_tasks.items():
-            all_tasks_duration += tag_tasks.duration
-        return all_tasks_duration
+        return self._all_tasks_duration
+
+    def filter(self, start: datetime, end: datetime) -> 'TaskAnalysis':
+        # keep the tasks overlapping [start, end), clipped to that window
+        tasks = []
+        for task in self.tasks:
+            if task.end <= start or task.start >= end:
+                continue
+            tasks.append(Task(
+                start=max(task.start, start),
+                end=min(task.end, end),
+                tags=task.tags[:],
+            ))
+        return TaskAnalysis(tasks, first_tag_only=self.first_tag_only)
 
 
 def extract_tags_from_string(s: str) -> list[str]:
-    # regex the description
-    pattern = r"\[(.*?)\]"
-    matches = re.findall(pattern, s)
+    # most messages carry no tags, so skip the regex when there is no bracket
+    if "[" not in s:
+        return []
 
-    tags: list[str] = []
-    if len(matches) == 0:
-        return tags
-    for match in matches[0].split(","):
-        tags.append(match.strip())
-    return tags
+    # only the first bracketed group holds the tags
+    match = _TAG_RE.search(s)
+    if match is None:
+        return []
+    return [tag.strip() for tag in match.group(1).split(",")]
 
 
 def convert_slack_messages_to_tasks(
@@ -216,20 +221,17 @@ def convert_slack_messages_to_tasks(
     start: datetime,
     end: datetime,
 ) -> list[Task]:
-    slack_messages.sort()
+    # slack returns messages newest first
+    slack_messages.reverse()
+
+    # each message lasts until the next one, except the first starts at
+    # start and the last ends at end
+    boundaries = [start]
+    boundaries.extend(msg.timestamp for msg in slack_messages[1:])
+    boundaries.append(end)
 
     tasks = []
-    n_msgs = len(slack_messages)
-    for i in range(n_msgs):
-        msg = slack_messages[i]
-        if i == 0:
-            cur_start = start
-        else:
-            cur_start = msg.timestamp
-        if i < n_msgs - 1:
-            cur_end = slack_messages[i+1].timestamp
-        else:
-            cur_end = end
+    for msg, (cur_start, cur_end) in zip(slack_messages, pairwise(boundaries)):
         tags = extract_tags_from_string(msg.text)
         if len(tags) == 0:
             continue
@@ -273,9 +275,9 @@ def main():
 
     # scrape the slack channel for messages
     channel_id = "D08TTLFB7RN"
-    slack_client = slack.SlackClient()
-    start = datetime(2025, 5, 20, pytz.utc)
-    end = datetime(2025, 5, 21, pytz.utc)
+    slack_client = slack.get_slack_client()
+    start = datetime(2025, 5, 20, tzinfo=timezone.utc)
+    end = datetime(2025, 5, 21, tzinfo=timezone.utc)
 
     print(audit_slack(
         slack_client=slack_client,
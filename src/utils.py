@@ -2,7 +2,4 @@
 
 
 def max_string_length(strings: list[str]) -> int:
-    max_chars = 0
-    for s in strings:
-        max_chars = max(max_chars, len(s))
-    return max_chars
+    return max(map(len, strings), default=0)